@@ -1,9 +1,32 @@
 from dataclasses import dataclass, asdict
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
 import json
+import sys
 
-@dataclass
+# Timestamp shared by all Meeting objects created or modified inside batch_timestamp()
+_batch_now: ContextVar[Optional[datetime]] = ContextVar('_batch_now', default=None)
+
+def _now() -> datetime:
+    """Current time, or the shared batch timestamp inside batch_timestamp()"""
+    return _batch_now.get() or datetime.now()
+
+@contextmanager
+def batch_timestamp():
+    """Stamp every meeting built or edited in the block with a single datetime.now()"""
+    token = _batch_now.set(datetime.now())
+    try:
+        yield
+    finally:
+        _batch_now.reset(token)
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share a single copy of strings repeated across records, like departments and job titles"""
+    return sys.intern(value) if type(value) is str else value
+
+@dataclass(slots=True)
 class Participant:
     """Participant data model"""
     email: str
@@ -25,9 +48,9 @@ class Participant:
             return cls(
                 email=str(data['email']),
                 name=str(data['name']),
-                department=data.get('department'),
-                title=data.get('title'),
-                availability_status=data.get('availability_status', 'unknown')
+                department=_intern(data.get('department')),
+                title=_intern(data.get('title')),
+                availability_status=_intern(data.get('availability_status', 'unknown'))
             )
         except (KeyError, TypeError, ValueError) as e:
             raise ValueError(f"Invalid participant data: {e}")
@@ -53,10 +76,12 @@ class Meeting:
     def __post_init__(self):
         if self.participants is None:
             self.participants = []
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = _now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
     
     def to_dict(self) -> Dict[str, Any]:
         try:
@@ -99,13 +124,13 @@ class Meeting:
                 try:
                     data_copy['created_at'] = datetime.fromisoformat(data_copy['created_at'])
                 except (ValueError, TypeError):
-                    data_copy['created_at'] = datetime.now()
+                    data_copy['created_at'] = _now()
                     
             if data_copy.get('updated_at'):
                 try:
                     data_copy['updated_at'] = datetime.fromisoformat(data_copy['updated_at'])
                 except (ValueError, TypeError):
-                    data_copy['updated_at'] = datetime.now()
+                    data_copy['updated_at'] = _now()
             
             # Convert participant dicts to objects with error handling
             if data_copy.get('participants'):
@@ -135,22 +160,25 @@ class Meeting:
         except Exception as e:
             raise ValueError(f"Invalid meeting data: {e}")
     
-    def add_participant(self, participant: Participant):
+    def add_participant(self, participant: Participant, now: Optional[datetime] = None):
         """Add a participant to the meeting"""
         try:
-            if participant and participant not in self.participants:
+            # Email is the natural key, so membership is decided on emails from the live list
+            if participant and participant.email not in {
+                p.email for p in self.participants if isinstance(p, Participant)
+            }:
                 self.participants.append(participant)
-                self.updated_at = datetime.now()
+                self.updated_at = now or _now()
         except Exception as e:
             raise ValueError(f"Error adding participant: {e}")
     
-    def remove_participant(self, email: str):
+    def remove_participant(self, email: str, now: Optional[datetime] = None):
         """Remove a participant by email"""
         try:
             original_count = len(self.participants)
             self.participants = [p for p in self.participants if p.email != email]
             if len(self.participants) < original_count:
-                self.updated_at = datetime.now()
+                self.updated_at = now or _now()
         except Exception as e:
             raise ValueError(f"Error removing participant: {e}")
     
@@ -0,0 +1,51 @@
+"""
+Regex patterns and lookup tables shared by NLPService and SimpleNLPService,
+compiled once at import
+"""
+
+import re
+
+# The third-party regex engine is faster on the hottest patterns and accepts the same syntax
+try:
+    import regex as re_fast
+except ImportError:
+    re_fast = re
+
+# Day offsets for relative day names
+RELATIVE_DAYS = {'today': 0, 'tomorrow': 1, 'yesterday': -1}
+
+DAYS_OF_WEEK = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Month names plus their usual abbreviations ("jan", "sept")
+MONTH_NAMES = {
+    **MONTHS,
+    **{month_name[:3]: month_num for month_name, month_num in MONTHS.items()},
+    'sept': 9,
+}
+
+# Each word of lowercased text, with the day number when one directly follows ("march 5")
+DATE_WORD_RE = re.compile(r'\b([a-z]+)\b(?:\s+(\d{1,2})\b)?')
+
+# Duration patterns
+DURATION_M_RE = re.compile(r'(?i)(\d+)\s*minutes?')
+HALF_HOUR_RE = re.compile(r'(?i)(half|1/2)\s*hour')
+
+# Email patterns: searching free text, and validating a whole string. The anchored
+# validation pattern fails or succeeds in a single pass, where the stdlib engine is quicker
+EMAIL_RE = re_fast.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+VALID_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Common meeting keywords
+MEETING_KEYWORDS = frozenset({
+    'meeting', 'call', 'sync', 'standup', 'review', 'discussion',
+    'session', 'presentation', 'demo', 'interview', 'chat'
+})
@@ -1,208 +1,235 @@
 import re
-import nltk
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
 from models import ParsedMeetingRequest
 import calendar
+from services._nlp_patterns import (
+    RELATIVE_DAYS, DAYS_OF_WEEK, MONTH_NAMES, DATE_WORD_RE, DURATION_M_RE, HALF_HOUR_RE, EMAIL_RE, MEETING_KEYWORDS, re_fast,
+)
 
 class NLPService:
     """Natural Language Processing for meeting requests"""
     
-    def __init__(self):
-        self._ensure_nltk_data()
-        self._init_patterns()
+    __slots__ = (
+        '_patterns_inited', 'time_patterns', 'duration_patterns',
+        'priority_patterns', '_rel_day_re', 'email_pattern', 'meeting_keywords',
+        '_title_re', '_name_patterns', '_quoted_re', '_numeric_date_re', '_master_re',
+        '_parse_cached', '_common_names',
+    )
     
-    def _ensure_nltk_data(self):
-        """Ensure required NLTK data is downloaded"""
-        try:
-            import nltk.data
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except (LookupError, ImportError):
-            try:
-                import ssl
-                try:
-                    _create_unverified_https_context = ssl._create_unverified_context
-                except AttributeError:
-                    pass
-                else:
-                    ssl._create_default_https_context = _create_unverified_https_context
-                
-                nltk.download('punkt', quiet=True)
-                nltk.download('stopwords', quiet=True)
-            except Exception as e:
-                # Complete fallback - NLTK functionality will be limited
-                print(f"Warning: NLTK data download failed: {e}. Using basic text processing.")
+    def __init__(self):
+        # Patterns are built on the first parse
+        self._patterns_inited = False
+        # Parse results keyed by (text, min_confidence, today) so relative dates expire daily
+        self._parse_cached = lru_cache(maxsize=4096)(self._parse)
     
     def _init_patterns(self):
         """Initialize regex patterns for parsing"""
         # Time patterns - improved with better error handling
-        self.time_patterns = [
+        self.time_patterns = [re.compile(p) for p in (
             r'(?i)(?:at\s+)?(\d{1,2}):(\d{2})\s*(am|pm)',
             r'(?i)(?:at\s+)?(\d{1,2})\s*(am|pm)',
             r'(?i)(?:at\s+)?(\d{1,2}):(\d{2})',
-        ]
+        )]
         
-        # Date patterns
-        self.date_patterns = [
-            r'(?i)(today|tomorrow|yesterday)',
-            r'(?i)(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'(?i)(next|this)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'(?i)(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2})',
-            r'(?i)(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})',
-            r'(?i)(\d{1,2})[\/\-](\d{1,2})',
-        ]
+        # Date formats like MM/DD or MM/DD/YYYY
+        self._numeric_date_re = re.compile(r'(\d{1,2})[\/\-](\d{1,2})(?:[\/\-](\d{2,4}))?')
         
-        # Duration patterns
+        # Duration patterns, paired with the kind of duration they capture
         self.duration_patterns = [
-            r'(?i)(\d+(?:\.\d+)?)\s*hours?\s*(\d+)?\s*minutes?',
-            r'(?i)(\d+(?:\.\d+)?)\s*hours?',
-            r'(?i)(\d+)\s*minutes?',
-            r'(?i)(\d+)\s*mins?',
-            r'(?i)(half|1/2)\s*hour',
+            (re.compile(r'(?i)(\d+(?:\.\d+)?)\s*hours?\s*(\d+)?\s*minutes?'), 'hours'),
+            (re.compile(r'(?i)(\d+(?:\.\d+)?)\s*hours?'), 'hours'),
+            (DURATION_M_RE, 'minutes'),
+            (re.compile(r'(?i)(\d+)\s*mins?'), 'minutes'),
+            (HALF_HOUR_RE, 'half'),
         ]
         
-        # Priority patterns
+        # Priority patterns, matched against lowercased text
         self.priority_patterns = [
-            r'(?i)(urgent|asap|immediately|critical)',
-            r'(?i)(high|important)\s*priority',
-            r'(?i)(low|normal)\s*priority',
+            re.compile(r'(urgent|asap|immediately|critical)'),
+            re.compile(r'(high|important)\s*priority'),
+            re.compile(r'(low|normal)\s*priority'),
         ]
         
+        # Relative day names, matched in a single scan
+        self._rel_day_re = re.compile(r'\b(today|tomorrow|yesterday)\b')
+        
         # Email patterns
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        self.email_pattern = EMAIL_RE
+        
+        # Participant name patterns like "with John", "and Sarah", "John and Mary"
+        self._name_patterns = [re.compile(p) for p in (
+            r'(?i)with\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+            r'(?i)and\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+            r'(?i)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+and',
+            r'(?i),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+        )]
+        
+        # Common first names recognised on their own
+        self._common_names = frozenset({
+            'John', 'Jane', 'Mike', 'Sarah', 'David', 'Emily', 'Chris', 'Lisa',
+            'James', 'Maria', 'Robert', 'Jennifer', 'Michael', 'Amy', 'Daniel',
+            'Jessica', 'Matthew', 'Ashley', 'Andrew', 'Amanda'
+        })
+        
+        # Quoted strings that might be titles
+        self._quoted_re = re.compile(r'"([^"]*)"')
         
         # Common meeting keywords
-        self.meeting_keywords = [
-            'meeting', 'call', 'sync', 'standup', 'review', 'discussion',
-            'session', 'presentation', 'demo', 'interview', 'chat'
-        ]
+        self.meeting_keywords = MEETING_KEYWORDS
+        
+        # Any meeting keyword with one word of context either side, matched against lowercased text
+        self._title_re = re.compile(
+            r'\b(\w+\s+)?(' + '|'.join(sorted(self.meeting_keywords)) + r')(\s+\w+)?\b'
+        )
+        
+        # Date, time, duration and priority mentions fused into one alternation, matched
+        # against lowercased text. Each group is a superset of what its extractor looks for,
+        # and digits are only looked behind at so one group never hides another.
+        self._master_re = re_fast.compile(
+            r'(?P<duration>hour|min)'
+            r'|(?P<time>(?<=\d)(?::\d{2}|\s*[ap]m))'
+            r'|(?P<date>\b(?:' + '|'.join([*RELATIVE_DAYS, *DAYS_OF_WEEK, *MONTH_NAMES]) + r')\b'
+            r'|(?<=\d)[/-]\d)'
+            r'|(?P<priority>urgent|asap|immediately|critical|(?:high|important|low|normal)\s*priority)'
+        )
+        
+        self._patterns_inited = True
     
-    def parse_meeting_request(self, text: str) -> ParsedMeetingRequest:
-        """Parse natural language meeting request"""
+    def parse_meeting_request(self, text: str, min_confidence: Optional[float] = None) -> ParsedMeetingRequest:
+        """Parse natural language meeting request
+        
+        If min_confidence is given, extraction stops as soon as the running
+        confidence reaches it and the remaining fields are left unset.
+        Results are memoized, so treat the returned object as read-only.
+        """
         text = text.strip()
         if not text:
             return ParsedMeetingRequest(original_text=text, confidence=0.0)
         
+        return self._parse_cached(text, min_confidence, date.today())
+    
+    def clear_cache(self):
+        """Drop all memoized parse results"""
+        self._parse_cached.cache_clear()
+    
+    def _parse(self, text: str, min_confidence: Optional[float], today: date) -> ParsedMeetingRequest:
+        """Uncached parse of stripped, non-empty text"""
+        if not self._patterns_inited:
+            self._init_patterns()
+        
         parsed = ParsedMeetingRequest(original_text=text)
         
+        # Keyword matching runs case-sensitively on a single lowercased copy
+        text_lower = text.lower()
+        
         try:
-            # Extract components with error handling
-            parsed.participant_names = self._extract_participant_names(text)
-            parsed.participant_emails = self._extract_emails(text)
-            parsed.date_mentioned = self._extract_date(text)
-            parsed.time_mentioned = self._extract_time(text)
-            parsed.duration_mentioned = self._extract_duration(text)
-            parsed.priority_mentioned = self._extract_priority(text)
-            parsed.title = self._extract_title(text)
-            parsed.description = self._extract_description(text)
+            # Extract components with error handling, accumulating confidence
+            confidence = self._keyword_confidence(text_lower)
+            for gain in self._extract_components(parsed, text, text_lower, today):
+                confidence += gain
+                if min_confidence is not None and confidence >= min_confidence:
+                    break
             
-            # Calculate confidence
-            parsed.confidence = self._calculate_confidence(parsed)
+            # Cap at 1.0
+            parsed.confidence = min(confidence, 1.0)
         except Exception as e:
             print(f"Warning: Error parsing meeting request: {e}")
             parsed.confidence = 0.1  # Low confidence due to parsing error
         
         return parsed
     
+    def _extract_components(self, parsed: ParsedMeetingRequest, text: str, text_lower: str, today: date):
+        """Fill in parsed fields, highest confidence contribution first, yielding each gain"""
+        # A single scan finds which components are mentioned; extractors for the rest are skipped
+        mentioned = {match.lastgroup for match in self._master_re.finditer(text_lower)}
+        
+        parsed.participant_emails = self._extract_emails(text) if '@' in text else []
+        yield 0.3 if parsed.participant_emails else 0.0
+        
+        parsed.date_mentioned = self._extract_date(text_lower, today) if 'date' in mentioned else None
+        yield 0.2 if parsed.date_mentioned else 0.0
+        
+        parsed.time_mentioned = self._extract_time(text) if 'time' in mentioned else None
+        yield 0.2 if parsed.time_mentioned else 0.0
+        
+        # Participants only count once, whether found by email or by name
+        parsed.participant_names = self._extract_participant_names(text)
+        yield 0.3 if parsed.participant_names and not parsed.participant_emails else 0.0
+        
+        parsed.title = self._extract_title(text, text_lower)
+        yield 0.1 if parsed.title else 0.0
+        
+        parsed.duration_mentioned = self._extract_duration(text) if 'duration' in mentioned else None
+        yield 0.1 if parsed.duration_mentioned else 0.0
+        
+        parsed.priority_mentioned = self._extract_priority(text_lower) if 'priority' in mentioned else None
+        yield 0.0
+        
+        parsed.description = self._extract_description(text)
+        yield 0.0
+    
     def _extract_participant_names(self, text: str) -> List[str]:
         """Extract participant names from text"""
-        names = []
+        # Names seen so far, in first-seen order (a dict doubles as an ordered set)
+        names = {}
         
         # Look for patterns like "with John", "and Sarah", "John and Mary"
-        patterns = [
-            r'(?i)with\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'(?i)and\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'(?i)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+and',
-            r'(?i),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-        ]
-        
-        for pattern in patterns:
-            try:
-                matches = re.findall(pattern, text)
-                names.extend(matches)
-            except Exception:
-                continue
+        for pattern in self._name_patterns:
+            names.update(dict.fromkeys(pattern.findall(text)))
         
         # Look for standalone names (common first names)
-        common_names = [
-            'John', 'Jane', 'Mike', 'Sarah', 'David', 'Emily', 'Chris', 'Lisa',
-            'James', 'Maria', 'Robert', 'Jennifer', 'Michael', 'Amy', 'Daniel',
-            'Jessica', 'Matthew', 'Ashley', 'Andrew', 'Amanda'
-        ]
-        
-        words = text.split()
-        for word in words:
-            if word in common_names and word not in names:
-                names.append(word)
+        for word in text.split():
+            if word in self._common_names:
+                names.setdefault(word)
         
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(names))
+        return list(names)
     
     def _extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from text"""
         try:
-            emails = re.findall(self.email_pattern, text)
-            return list(set(emails))  # Remove duplicates
+            # Remove duplicates while preserving order
+            return list(dict.fromkeys(self.email_pattern.findall(text)))
         except Exception:
             return []
     
-    def _extract_date(self, text: str) -> Optional[date]:
-        """Extract date from text with better error handling"""
+    def _extract_date(self, text_lower: str, today: date) -> Optional[date]:
+        """Extract date relative to today from lowercased text with better error handling"""
         try:
-            today = date.today()
-            
-            # Relative dates
-            if re.search(r'(?i)\btoday\b', text):
-                return today
-            elif re.search(r'(?i)\btomorrow\b', text):
-                return today + timedelta(days=1)
-            elif re.search(r'(?i)\byesterday\b', text):
-                return today - timedelta(days=1)
-            
-            # Day names
-            days_of_week = {
-                'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-                'friday': 4, 'saturday': 5, 'sunday': 6
-            }
+            # Relative dates, found in one scan; today beats tomorrow beats yesterday wherever they appear
+            relative_days = set(self._rel_day_re.findall(text_lower))
+            for day_name, offset in RELATIVE_DAYS.items():
+                if day_name in relative_days:
+                    return today + timedelta(days=offset)
             
-            for day_name, day_num in days_of_week.items():
-                if re.search(rf'(?i)\b{day_name}\b', text):
+            # Day names (including "next"/"this" + day name) win over month + day,
+            # and both are found in a single pass over the words
+            month_date = None
+            for word, day_text in DATE_WORD_RE.findall(text_lower):
+                day_num = DAYS_OF_WEEK.get(word)
+                if day_num is not None:
                     days_ahead = day_num - today.weekday()
                     if days_ahead <= 0:  # Target day already happened this week
                         days_ahead += 7
                     return today + timedelta(days=days_ahead)
+                
+                month_num = MONTH_NAMES.get(word)
+                if month_num and day_text and month_date is None:
+                    day = int(day_text)
+                    year = today.year
+                    # If the month has passed this year, assume next year
+                    if month_num < today.month or (month_num == today.month and day < today.day):
+                        year += 1
+                    # Skip impossible days (e.g. February 30) instead of raising
+                    if 1 <= day <= calendar.monthrange(year, month_num)[1]:
+                        month_date = date(year, month_num, day)
             
-            # Next/this + day name
-            for day_name, day_num in days_of_week.items():
-                if re.search(rf'(?i)\b(?:next|this)\s+{day_name}\b', text):
-                    days_ahead = day_num - today.weekday()
-                    if days_ahead <= 0:
-                        days_ahead += 7
-                    return today + timedelta(days=days_ahead)
-            
-            # Month day patterns
-            months = {
-                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                'september': 9, 'october': 10, 'november': 11, 'december': 12
-            }
-            
-            for month_name, month_num in months.items():
-                match = re.search(rf'(?i)\b{month_name}\s+(\d{{1,2}})\b', text)
-                if match:
-                    try:
-                        day = int(match.group(1))
-                        year = today.year
-                        # If the month has passed this year, assume next year
-                        if month_num < today.month or (month_num == today.month and day < today.day):
-                            year += 1
-                        return date(year, month_num, day)
-                    except (ValueError, OverflowError):
-                        continue
+            if month_date:
+                return month_date
             
             # Date formats like MM/DD or MM/DD/YYYY
-            date_match = re.search(r'(\d{1,2})[\/\-](\d{1,2})(?:[\/\-](\d{2,4}))?', text)
+            date_match = self._numeric_date_re.search(text_lower)
             if date_match:
                 try:
                     month = int(date_match.group(1))
@@ -223,48 +250,39 @@ class NLPService:
         """Extract time from text with improved error handling"""
         try:
             for pattern in self.time_patterns:
-                match = re.search(pattern, text)
+                match = pattern.search(text)
                 if match:
                     groups = match.groups()
                     
                     if len(groups) == 3:  # HH:MM AM/PM
                         hour, minute, period = groups
-                        try:
-                            hour_int = int(hour)
-                            minute_int = int(minute) if minute else 0
-                            
-                            # Validate hour and minute ranges
-                            if 1 <= hour_int <= 12 and 0 <= minute_int <= 59:
-                                return f"{hour_int}:{minute_int:02d} {period.upper()}"
-                        except ValueError:
-                            continue
+                        hour_int = int(hour)
+                        minute_int = int(minute) if minute else 0
+                        
+                        # Validate hour and minute ranges
+                        if 1 <= hour_int <= 12 and 0 <= minute_int <= 59:
+                            return f"{hour_int}:{minute_int:02d} {period.upper()}"
                     
                     elif len(groups) == 2:
                         if groups[1].lower() in ['am', 'pm']:  # H AM/PM
                             hour, period = groups
-                            try:
-                                hour_int = int(hour)
-                                if 1 <= hour_int <= 12:
-                                    return f"{hour_int}:00 {period.upper()}"
-                            except ValueError:
-                                continue
+                            hour_int = int(hour)
+                            if 1 <= hour_int <= 12:
+                                return f"{hour_int}:00 {period.upper()}"
                         else:  # HH:MM (24 hour)
                             hour, minute = groups
-                            try:
-                                hour_int = int(hour)
-                                minute_int = int(minute)
-                                
-                                if 0 <= hour_int <= 23 and 0 <= minute_int <= 59:
-                                    if hour_int > 12:
-                                        return f"{hour_int - 12}:{minute_int:02d} PM"
-                                    elif hour_int == 12:
-                                        return f"12:{minute_int:02d} PM"
-                                    elif hour_int == 0:
-                                        return f"12:{minute_int:02d} AM"
-                                    else:
-                                        return f"{hour_int}:{minute_int:02d} AM"
-                            except ValueError:
-                                continue
+                            hour_int = int(hour)
+                            minute_int = int(minute)
+                            
+                            if 0 <= hour_int <= 23 and 0 <= minute_int <= 59:
+                                if hour_int > 12:
+                                    return f"{hour_int - 12}:{minute_int:02d} PM"
+                                elif hour_int == 12:
+                                    return f"12:{minute_int:02d} PM"
+                                elif hour_int == 0:
+                                    return f"12:{minute_int:02d} AM"
+                                else:
+                                    return f"{hour_int}:{minute_int:02d} AM"
         except Exception as e:
             print(f"Warning: Error extracting time: {e}")
         
@@ -273,52 +291,45 @@ class NLPService:
     def _extract_duration(self, text: str) -> Optional[str]:
         """Extract duration from text with better error handling"""
         try:
-            for pattern in self.duration_patterns:
-                match = re.search(pattern, text)
+            for pattern, kind in self.duration_patterns:
+                match = pattern.search(text)
                 if match:
-                    match_text = match.group(0).lower()
-                    
-                    if 'half' in match_text or '1/2' in match_text:
-                        return "30 minutes"
-                    
-                    elif 'hour' in match_text:
-                        try:
-                            hours = float(match.group(1))
-                            minutes = int(match.group(2)) if len(match.groups()) > 1 and match.group(2) else 0
-                            
-                            if hours == 1 and minutes == 0:
-                                return "1 hour"
-                            elif hours == 1.5 or (hours == 1 and minutes == 30):
-                                return "1.5 hours"
-                            elif hours == 2 and minutes == 0:
-                                return "2 hours"
-                            else:
-                                total_minutes = int(hours * 60) + minutes
-                                if total_minutes <= 0:
-                                    continue
-                                return f"{total_minutes} minutes"
-                        except (ValueError, OverflowError):
-                            continue
-                    
-                    elif 'minute' in match_text or 'min' in match_text:
-                        try:
-                            minutes = int(match.group(1))
-                            if minutes > 0:
-                                return f"{minutes} minutes"
-                        except (ValueError, OverflowError):
-                            continue
+                    duration = self._format_duration(kind, match)
+                    if duration:
+                        return duration
         except Exception as e:
             print(f"Warning: Error extracting duration: {e}")
         
         return None
     
-    def _extract_priority(self, text: str) -> Optional[str]:
-        """Extract priority from text"""
+    def _format_duration(self, kind: str, match) -> Optional[str]:
+        """Format a duration match by the kind of pattern that produced it, or None if it is zero"""
+        if kind == 'half':
+            return "30 minutes"
+        
+        if kind == 'hours':
+            hours = float(match.group(1))
+            minutes = int(match.group(2)) if match.re.groups > 1 and match.group(2) else 0
+            
+            if hours == 1 and minutes == 0:
+                return "1 hour"
+            elif hours == 1.5 or (hours == 1 and minutes == 30):
+                return "1.5 hours"
+            elif hours == 2 and minutes == 0:
+                return "2 hours"
+            total_minutes = int(hours * 60) + minutes
+            return f"{total_minutes} minutes" if total_minutes > 0 else None
+        
+        minutes = int(match.group(1))
+        return f"{minutes} minutes" if minutes > 0 else None
+    
+    def _extract_priority(self, text_lower: str) -> Optional[str]:
+        """Extract priority from lowercased text"""
         try:
             for pattern in self.priority_patterns:
-                match = re.search(pattern, text)
+                match = pattern.search(text_lower)
                 if match:
-                    priority_text = match.group(1).lower()
+                    priority_text = match.group(1)
                     if priority_text in ['urgent', 'asap', 'immediately', 'critical']:
                         return "urgent"
                     elif priority_text in ['high', 'important']:
@@ -330,24 +341,19 @@ class NLPService:
         
         return None
     
-    def _extract_title(self, text: str) -> Optional[str]:
+    def _extract_title(self, text: str, text_lower: str) -> Optional[str]:
         """Extract or generate meeting title"""
         try:
             # Look for quoted strings that might be titles
-            quoted_matches = re.findall(r'"([^"]*)"', text)
+            quoted_matches = self._quoted_re.findall(text)
             if quoted_matches and quoted_matches[0].strip():
                 return quoted_matches[0].strip()
             
             # Look for meeting keywords and use surrounding context
-            for keyword in self.meeting_keywords:
-                if keyword in text.lower():
-                    # Try to find a descriptive phrase around the keyword
-                    pattern = rf'(?i)(\w+\s+)?{keyword}(\s+\w+)?'
-                    match = re.search(pattern, text)
-                    if match:
-                        title = match.group(0).strip()
-                        if len(title) > 5:  # Avoid single words
-                            return title.title()
+            for match in self._title_re.finditer(text_lower):
+                title = match.group(0).strip()
+                if len(title) > 5:  # Avoid single words
+                    return title.title()
             
             # Fallback: use first few words if no specific title found
             words = text.split()[:5]
@@ -370,36 +376,24 @@ class NLPService:
         
         return None
     
-    def _calculate_confidence(self, parsed: ParsedMeetingRequest) -> float:
-        """Calculate confidence score for the parsing"""
-        try:
-            confidence = 0.0
-            
-            # Base confidence for having any content
-            if parsed.original_text:
-                confidence += 0.1
-            
-            # Boost for each component found
-            if parsed.participant_names or parsed.participant_emails:
-                confidence += 0.3
-            if parsed.date_mentioned:
-                confidence += 0.2
-            if parsed.time_mentioned:
-                confidence += 0.2
-            if parsed.duration_mentioned:
-                confidence += 0.1
-            if parsed.title:
-                confidence += 0.1
-            
-            # Boost for meeting-related keywords
-            text_lower = parsed.original_text.lower()
-            meeting_words_found = sum(1 for keyword in self.meeting_keywords if keyword in text_lower)
-            confidence += min(meeting_words_found * 0.05, 0.15)
-            
-            # Cap at 1.0
-            return min(confidence, 1.0)
-        except Exception:
-            return 0.1  # Minimal confidence if calculation fails
+    def _keyword_confidence(self, text_lower: str) -> float:
+        """Confidence available before extraction: having content plus meeting keywords"""
+        # Base confidence for having any content
+        confidence = 0.1
+        
+        # Boost for meeting-related keywords
+        meeting_words_found = sum(1 for keyword in self.meeting_keywords if keyword in text_lower)
+        confidence += min(meeting_words_found * 0.05, 0.15)
+        
+        return confidence
+
+# Global instance, created on first access
+_nlp_service = None
 
-# Global instance
-nlp_service = NLPService()
+def __getattr__(name):
+    global _nlp_service
+    if name == 'nlp_service':
+        if _nlp_service is None:
+            _nlp_service = NLPService()
+        return _nlp_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
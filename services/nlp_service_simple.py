@@ -2,6 +2,29 @@ import re
 from datetime import datetime, date, timedelta
 from typing import List, Optional
 from models import ParsedMeetingRequest
+from services._nlp_patterns import RELATIVE_DAYS, DAYS_OF_WEEK, DURATION_M_RE, HALF_HOUR_RE, EMAIL_RE
+
+# Confidence added for: any content, participants, date, time, a meeting keyword
+_CONFIDENCE_WEIGHTS = (0.1, 0.3, 0.3, 0.2, 0.1)
+
+# Priority keywords checked by _extract_priority, most urgent first
+_PRIORITY_LEVELS = (
+    (('urgent', 'asap', 'critical'), "urgent"),
+    (('high', 'important'), "high"),
+    (('low', 'normal'), "low"),
+)
+
+def _wb_contains(text: str, word: str) -> bool:
+    """Check whether word occurs in text as a whole word, without the regex engine"""
+    end = len(word)
+    i = text.find(word)
+    while i != -1:
+        before = text[i - 1] if i else ' '
+        after = text[i + end] if i + end < len(text) else ' '
+        if not (before.isalnum() or before == '_' or after.isalnum() or after == '_'):
+            return True
+        i = text.find(word, i + 1)
+    return False
 
 class SimpleNLPService:
     """Simple fallback NLP service without NLTK dependencies"""
@@ -12,38 +35,26 @@ class SimpleNLPService:
     def _init_patterns(self):
         """Initialize regex patterns for parsing"""
         # Time patterns
-        self.time_patterns = [
+        self.time_patterns = [re.compile(p) for p in (
             r'(?i)(?:at\s+)?(\d{1,2}):?(\d{0,2})\s*(am|pm)',
             r'(?i)(?:at\s+)?(\d{1,2})\s*(am|pm)',
             r'(?i)(\d{1,2}):(\d{2})',
-        ]
-        
-        # Date patterns
-        self.date_patterns = [
-            r'(?i)(today|tomorrow|yesterday)',
-            r'(?i)(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'(?i)(next|this)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-        ]
+        )]
         
-        # Duration patterns
-        self.duration_patterns = [
-            r'(?i)(\d+)\s*hours?\s*(\d+)?\s*minutes?',
-            r'(?i)(\d+)\s*hours?',
-            r'(?i)(\d+)\s*minutes?',
-            r'(?i)(half|1/2)\s*hour',
-        ]
-        
-        # Priority patterns
-        self.priority_patterns = [
-            r'(?i)(urgent|asap|immediately|critical)',
-            r'(?i)(high|important)\s*priority',
-            r'(?i)(low|normal)\s*priority',
-        ]
+        # Hours duration pattern; minutes and half an hour use the shared patterns
+        self._hours_re = re.compile(r'(?i)(\d+)\s*hours?')
         
         # Email patterns
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        self.email_pattern = EMAIL_RE
+        
+        # Name patterns like "with John", "and Sarah"
+        self._name_patterns = [re.compile(p) for p in (
+            r'(?i)with\s+([A-Z][a-z]+)',
+            r'(?i)and\s+([A-Z][a-z]+)',
+            r'(?i)([A-Z][a-z]+)\s+and',
+        )]
         
-        # Meeting keywords
+        # Meeting keywords, deliberately narrower than the shared MEETING_KEYWORDS
         self.meeting_keywords = [
             'meeting', 'call', 'sync', 'standup', 'review', 'discussion'
         ]
@@ -55,15 +66,16 @@ class SimpleNLPService:
             return ParsedMeetingRequest(original_text=text, confidence=0.0)
         
         parsed = ParsedMeetingRequest(original_text=text)
+        text_lower = text.lower()
         
         # Extract components
         parsed.participant_names = self._extract_names(text)
         parsed.participant_emails = self._extract_emails(text)
-        parsed.date_mentioned = self._extract_date(text)
+        parsed.date_mentioned = self._extract_date(text_lower)
         parsed.time_mentioned = self._extract_time(text)
         parsed.duration_mentioned = self._extract_duration(text)
-        parsed.priority_mentioned = self._extract_priority(text)
-        parsed.title = self._extract_title(text)
+        parsed.priority_mentioned = self._extract_priority(text_lower)
+        parsed.title = self._extract_title(text, text_lower)
         parsed.description = text if len(text) > 20 else None
         
         # Calculate confidence
@@ -76,42 +88,27 @@ class SimpleNLPService:
         names = []
         
         # Look for patterns like "with John", "and Sarah"
-        patterns = [
-            r'(?i)with\s+([A-Z][a-z]+)',
-            r'(?i)and\s+([A-Z][a-z]+)',
-            r'(?i)([A-Z][a-z]+)\s+and',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            names.extend(matches)
+        for pattern in self._name_patterns:
+            names.extend(pattern.findall(text))
         
-        return list(set(names))  # Remove duplicates
+        return list(dict.fromkeys(names))  # Remove duplicates, keeping first-seen order
     
     def _extract_emails(self, text: str) -> List[str]:
         """Extract email addresses"""
-        emails = re.findall(self.email_pattern, text)
-        return list(set(emails))
+        # Remove duplicates while preserving order
+        return list(dict.fromkeys(self.email_pattern.findall(text)))
     
-    def _extract_date(self, text: str) -> Optional[date]:
-        """Extract date from text"""
+    def _extract_date(self, text_lower: str) -> Optional[date]:
+        """Extract date from lowercased text"""
         today = date.today()
         
-        if re.search(r'(?i)\btoday\b', text):
-            return today
-        elif re.search(r'(?i)\btomorrow\b', text):
-            return today + timedelta(days=1)
-        elif re.search(r'(?i)\byesterday\b', text):
-            return today - timedelta(days=1)
+        for day_name, offset in RELATIVE_DAYS.items():
+            if _wb_contains(text_lower, day_name):
+                return today + timedelta(days=offset)
         
         # Day names
-        days_of_week = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        for day_name, day_num in days_of_week.items():
-            if re.search(rf'(?i)\b{day_name}\b', text):
+        for day_name, day_num in DAYS_OF_WEEK.items():
+            if _wb_contains(text_lower, day_name):
                 days_ahead = day_num - today.weekday()
                 if days_ahead <= 0:
                     days_ahead += 7
@@ -122,7 +119,7 @@ class SimpleNLPService:
     def _extract_time(self, text: str) -> Optional[str]:
         """Extract time from text"""
         for pattern in self.time_patterns:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) == 3:  # HH:MM AM/PM
@@ -137,36 +134,33 @@ class SimpleNLPService:
     
     def _extract_duration(self, text: str) -> Optional[str]:
         """Extract duration from text"""
-        if re.search(r'(?i)(half|1/2)\s*hour', text):
+        if HALF_HOUR_RE.search(text):
             return "30 minutes"
         
-        hour_match = re.search(r'(?i)(\d+)\s*hours?', text)
+        hour_match = self._hours_re.search(text)
         if hour_match:
             hours = int(hour_match.group(1))
             return f"{hours} hour{'s' if hours > 1 else ''}"
         
-        minute_match = re.search(r'(?i)(\d+)\s*minutes?', text)
+        minute_match = DURATION_M_RE.search(text)
         if minute_match:
             minutes = int(minute_match.group(1))
             return f"{minutes} minutes"
         
         return None
     
-    def _extract_priority(self, text: str) -> Optional[str]:
-        """Extract priority from text"""
-        if re.search(r'(?i)(urgent|asap|critical)', text):
-            return "urgent"
-        elif re.search(r'(?i)(high|important)', text):
-            return "high"
-        elif re.search(r'(?i)(low|normal)', text):
-            return "low"
+    def _extract_priority(self, text_lower: str) -> Optional[str]:
+        """Extract priority from lowercased text"""
+        for keywords, priority in _PRIORITY_LEVELS:
+            if any(keyword in text_lower for keyword in keywords):
+                return priority
         return None
     
-    def _extract_title(self, text: str) -> Optional[str]:
+    def _extract_title(self, text: str, text_lower: str) -> Optional[str]:
         """Extract or generate meeting title"""
         # Look for meeting keywords
         for keyword in self.meeting_keywords:
-            if keyword in text.lower():
+            if keyword in text_lower:
                 return f"{keyword.title()}"
         
         # Use first few words
@@ -174,21 +168,26 @@ class SimpleNLPService:
         return ' '.join(words).title() if len(words) >= 2 else "New Meeting"
     
     def _calculate_confidence(self, parsed: ParsedMeetingRequest) -> float:
-        """Calculate confidence score"""
-        confidence = 0.0
-        
-        if parsed.original_text:
-            confidence += 0.1
-        if parsed.participant_names or parsed.participant_emails:
-            confidence += 0.3
-        if parsed.date_mentioned:
-            confidence += 0.3
-        if parsed.time_mentioned:
-            confidence += 0.2
-        if any(keyword in parsed.original_text.lower() for keyword in self.meeting_keywords):
-            confidence += 0.1
+        """Calculate confidence score as a weighted sum of the components found"""
+        text_lower = parsed.original_text.lower()
+        found = (
+            parsed.original_text,
+            parsed.participant_names or parsed.participant_emails,
+            parsed.date_mentioned,
+            parsed.time_mentioned,
+            any(keyword in text_lower for keyword in self.meeting_keywords),
+        )
+        confidence = sum(weight for present, weight in zip(found, _CONFIDENCE_WEIGHTS) if present)
         
         return min(confidence, 1.0)
 
-# Global instance
-simple_nlp_service = SimpleNLPService()
+# Global instance, created on first access
+_simple_nlp_service = None
+
+def __getattr__(name):
+    global _simple_nlp_service
+    if name == 'simple_nlp_service':
+        if _simple_nlp_service is None:
+            _simple_nlp_service = SimpleNLPService()
+        return _simple_nlp_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
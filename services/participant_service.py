@@ -1,13 +1,42 @@
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from models import Participant, ParticipantMatch
 from utils.mock_data import mock_data
-import re
+from services._nlp_patterns import VALID_EMAIL_RE
 
 class ParticipantService:
     """Service for resolving and managing participants"""
     
     def __init__(self):
         self.mock_data = mock_data
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """Index the directory by lowercased full name, first name, last name and name word"""
+        participants = self.mock_data.mock_participants
+        self._by_exact: Dict[str, List[Participant]] = {}
+        self._by_first: Dict[str, List[Participant]] = {}
+        self._by_last: Dict[str, List[Participant]] = {}
+        self._by_token: Dict[str, List[Participant]] = {}
+        # Lowercased names and their words, parallel to the participant list, for the fuzzy scan
+        self._names_lower: List[str] = [participant.name.lower() for participant in participants]
+        self._name_words: List[List[str]] = [name.split() for name in self._names_lower]
+        
+        for participant, name_lower in zip(participants, self._names_lower):
+            participant_name = name_lower.strip()
+            name_words = participant_name.split()
+            if not name_words:
+                continue
+            self._by_exact.setdefault(participant_name, []).append(participant)
+            self._by_first.setdefault(name_words[0], []).append(participant)
+            if len(name_words) > 1:
+                self._by_last.setdefault(name_words[-1], []).append(participant)
+            for word in dict.fromkeys(name_words):
+                self._by_token.setdefault(word, []).append(participant)
+        
+        # The directory tuple these indexes describe, and the generator version it was taken at
+        self._indexed_participants = participants
+        self._indexed_version = self.mock_data.directory_version
     
     def resolve_participants(self, names: List[str], emails: List[str]) -> List[ParticipantMatch]:
         """Resolve participant names and emails to actual participants"""
@@ -54,67 +83,78 @@ class ParticipantService:
         
         return matches
     
-    def _is_valid_email(self, email: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _is_valid_email(email: str) -> bool:
         """Check if string is a valid email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(VALID_EMAIL_RE.match(email))
     
-    def _extract_name_from_email(self, email: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_name_from_email(email: str) -> str:
         """Extract a display name from email address"""
-        local_part = email.split('@')[0]
+        local_part = email.partition('@')[0]
         # Replace dots and underscores with spaces, title case
         name = local_part.replace('.', ' ').replace('_', ' ').title()
         return name
     
     def _search_participants_by_name(self, name: str) -> List[Participant]:
-        """Search for participants by name using fuzzy matching"""
+        """Search for participants by name using the directory index, then fuzzy matching"""
         name = name.lower().strip()
         if not name:
             return []
         
-        participants = self.mock_data.get_participants()
-        matches = []
+        if self._indexed_version != self.mock_data.directory_version:
+            self._rebuild_index()
         
-        for participant in participants:
-            participant_name = participant.name.lower()
-            
-            # Exact match
-            if name == participant_name:
-                matches.insert(0, participant)
-                continue
-            
-            # First name match
-            first_name = participant_name.split()[0]
-            if name == first_name:
-                matches.append(participant)
-                continue
-            
-            # Last name match
-            name_parts = participant_name.split()
-            if len(name_parts) > 1 and name == name_parts[-1]:
-                matches.append(participant)
-                continue
-            
-            # Partial match
-            if name in participant_name or participant_name in name:
-                matches.append(participant)
-                continue
-            
-            # Check if any word in the query matches any word in the participant name
-            query_words = name.split()
-            name_words = participant_name.split()
-            if any(qw in nw or nw in qw for qw in query_words for nw in name_words):
-                matches.append(participant)
+        query_words = name.split()
+        exact_matches = self._by_exact.get(name)
+        if exact_matches:
+            # An exact full-name hit settles the search
+            candidates = [exact_matches]
+        else:
+            # Indexed hits in priority order: first name, last name, all query words
+            candidates = [
+                self._by_first.get(name, []),
+                self._by_last.get(name, []),
+            ]
+            word_emails = [{p.email for p in self._by_token.get(word, [])} for word in query_words]
+            shared_emails = set.intersection(*word_emails)
+            if shared_emails:
+                candidates.append([p for p in self._by_token[query_words[0]] if p.email in shared_emails])
         
         # Remove duplicates while preserving order
         seen = set()
-        unique_matches = []
-        for match in matches:
-            if match.email not in seen:
-                seen.add(match.email)
-                unique_matches.append(match)
+        matches = []
+        for group in candidates:
+            for participant in group:
+                if participant.email not in seen:
+                    seen.add(participant.email)
+                    matches.append(participant)
+        
+        if not matches:
+            matches = self._fuzzy_search_participants(name, query_words)
         
-        return unique_matches[:10]  # Limit to top 10 matches
+        return matches[:10]  # Limit to top 10 matches
+    
+    def _fuzzy_search_participants(self, name: str, query_words: List[str]) -> List[Participant]:
+        """Scan the directory for partial name matches when no indexed key matches"""
+        matches = []
+        seen = set()
+        participants = self._indexed_participants
+        
+        for i, participant_name in enumerate(self._names_lower):
+            name_words = self._name_words[i]
+            
+            # Partial match, or any query word overlapping any name word
+            if (name in participant_name or participant_name in name
+                    or any(qw in nw or nw in qw for qw in query_words for nw in name_words)):
+                participant = participants[i]
+                if participant.email not in seen:
+                    seen.add(participant.email)
+                    matches.append(participant)
+        
+        return matches
     
     def _calculate_name_confidence(self, query: str, matches: List[Participant]) -> float:
         """Calculate confidence score for name matching"""
@@ -162,27 +202,27 @@ class ParticipantService:
     
     def validate_participant_list(self, participants: List[Participant]) -> Dict[str, List[str]]:
         """Validate a list of participants and return any issues"""
+        emails = [participant.email for participant in participants]
+        emails_lower = [email.lower() for email in emails]
+        
         issues = {
-            'invalid_emails': [],
+            'invalid_emails': [email for email in emails if not self._is_valid_email(email)],
             'duplicates': [],
-            'missing_info': []
+            'missing_info': [
+                f"Missing name for {participant.email}"
+                for participant in participants
+                if not participant.name or not participant.name.strip()
+            ]
         }
         
-        seen_emails = set()
-        for participant in participants:
-            # Check for invalid emails
-            if not self._is_valid_email(participant.email):
-                issues['invalid_emails'].append(participant.email)
-            
-            # Check for duplicates
-            if participant.email.lower() in seen_emails:
-                issues['duplicates'].append(participant.email)
-            else:
-                seen_emails.add(participant.email.lower())
-            
-            # Check for missing information
-            if not participant.name or not participant.name.strip():
-                issues['missing_info'].append(f"Missing name for {participant.email}")
+        # Report every repeat of an address after its first appearance, scanning only when there is one
+        if len(set(emails_lower)) < len(emails_lower):
+            seen_emails = set()
+            for email, email_lower in zip(emails, emails_lower):
+                if email_lower in seen_emails:
+                    issues['duplicates'].append(email)
+                else:
+                    seen_emails.add(email_lower)
         
         return issues
     
@@ -222,5 +262,13 @@ class ParticipantService:
         
         return availability
 
-# Global instance
-participant_service = ParticipantService()
+# Global instance, created on first access
+_participant_service = None
+
+def __getattr__(name):
+    global _participant_service
+    if name == 'participant_service':
+        if _participant_service is None:
+            _participant_service = ParticipantService()
+        return _participant_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
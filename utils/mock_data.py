@@ -1,87 +1,173 @@
 import json
-import random
+import numpy as np
 from datetime import datetime, timedelta, date
-from typing import List, Dict
-from models import Participant, Meeting
+from typing import List, Dict, Optional, Sequence, Tuple
+from models import Participant, Meeting, batch_timestamp
+
+# orjson (de)serializes several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Mock company directory entries: email, name, department, title
+_DIRECTORY = (
+    ("john.smith@company.com", "John Smith", "Engineering", "Software Engineer"),
+    ("sarah.johnson@company.com", "Sarah Johnson", "Marketing", "Marketing Manager"),
+    ("mike.davis@company.com", "Mike Davis", "Sales", "Sales Representative"),
+    ("emily.brown@company.com", "Emily Brown", "HR", "HR Manager"),
+    ("david.wilson@company.com", "David Wilson", "Engineering", "Senior Developer"),
+    ("lisa.anderson@company.com", "Lisa Anderson", "Finance", "Financial Analyst"),
+    ("james.taylor@company.com", "James Taylor", "Operations", "Operations Manager"),
+    ("maria.garcia@company.com", "Maria Garcia", "Design", "UX Designer"),
+    ("robert.martinez@company.com", "Robert Martinez", "Engineering", "Tech Lead"),
+    ("jennifer.lee@company.com", "Jennifer Lee", "Marketing", "Content Manager"),
+    ("michael.johnson@company.com", "Michael Johnson", "Sales", "Account Executive"),
+    ("sarah.davis@company.com", "Sarah Davis", "Engineering", "QA Engineer"),
+    ("john.brown@company.com", "John Brown", "Finance", "Controller"),
+    ("amy.wilson@company.com", "Amy Wilson", "HR", "Recruiter"),
+    ("chris.miller@company.com", "Chris Miller", "Operations", "Project Manager"),
+)
+
+_MEETING_TITLES = (
+    "Daily Standup", "Sprint Planning", "Client Review", "Team Retrospective",
+    "Project Kickoff", "Budget Meeting", "Training Session", "All Hands",
+    "Design Review", "Code Review", "Strategy Meeting", "Performance Review"
+)
+
+# Mock meeting lengths in minutes, with their timedeltas built once
+_DURATION_DELTAS = {minutes: timedelta(minutes=minutes) for minutes in (30, 60, 90, 120)}
+_ONE_DAY = timedelta(days=1)
 
 class MockDataGenerator:
-    """Generate realistic mock data for testing"""
+    """Generate realistic mock data for testing
+    
+    The directory and the meetings are held as read-only tuples. Replace them through
+    set_participants/add_participant and set_meetings/add_meeting, or by assigning
+    mock_participants/mock_meetings, never by editing them in place, so the lookup
+    indexes and directory_version stay current.
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        # One generator drives every random draw, so a single seed reproduces all of the mock data
+        self._rng = np.random.default_rng(seed)
+        # Bumped every time the directory changes, so dependent indexes know to rebuild
+        self.directory_version = 0
+        self.set_participants(self._generate_mock_participants())
+        with batch_timestamp():
+            self.set_meetings(self._generate_mock_meetings())
+    
+    @property
+    def mock_participants(self) -> Tuple[Participant, ...]:
+        """The current directory, as a read-only tuple"""
+        return self._participants
+    
+    @mock_participants.setter
+    def mock_participants(self, participants: Sequence[Participant]):
+        self.set_participants(participants)
     
-    def __init__(self):
-        self.mock_participants = self._generate_mock_participants()
-        self.mock_meetings = self._generate_mock_meetings()
+    def set_participants(self, participants: Sequence[Participant]):
+        """Replace the directory and rebuild its indexes"""
+        self._participants = tuple(participants)
+        self._reindex()
+    
+    def add_participant(self, participant: Participant):
+        """Add a participant to the directory and rebuild its indexes"""
+        self.set_participants(self._participants + (participant,))
+    
+    @property
+    def mock_meetings(self) -> Tuple[Meeting, ...]:
+        """The current meetings, as a read-only tuple"""
+        return self._meetings
+    
+    @mock_meetings.setter
+    def mock_meetings(self, meetings: Sequence[Meeting]):
+        self.set_meetings(meetings)
+    
+    def set_meetings(self, meetings: Sequence[Meeting]):
+        """Replace all mock meetings"""
+        self._meetings = tuple(meetings)
+    
+    def add_meeting(self, meeting: Meeting):
+        """Add a meeting to the mock meetings"""
+        self._meetings += (meeting,)
+    
+    def _reindex(self):
+        """Build the lowercased email and search indexes for the current directory"""
+        # Lowercased names and emails, parallel to the directory, computed once per participant
+        self._names_lower: List[str] = [participant.name.lower() for participant in self._participants]
+        self._emails_lower: List[str] = [participant.email.lower() for participant in self._participants]
+        
+        self._by_email: Dict[str, Participant] = {}
+        for email_lower, participant in zip(self._emails_lower, self._participants):
+            self._by_email.setdefault(email_lower, participant)
+        self.directory_version += 1
     
     def _generate_mock_participants(self) -> List[Participant]:
         """Generate mock company directory"""
-        participants = [
-            Participant("john.smith@company.com", "John Smith", "Engineering", "Software Engineer"),
-            Participant("sarah.johnson@company.com", "Sarah Johnson", "Marketing", "Marketing Manager"),
-            Participant("mike.davis@company.com", "Mike Davis", "Sales", "Sales Representative"),
-            Participant("emily.brown@company.com", "Emily Brown", "HR", "HR Manager"),
-            Participant("david.wilson@company.com", "David Wilson", "Engineering", "Senior Developer"),
-            Participant("lisa.anderson@company.com", "Lisa Anderson", "Finance", "Financial Analyst"),
-            Participant("james.taylor@company.com", "James Taylor", "Operations", "Operations Manager"),
-            Participant("maria.garcia@company.com", "Maria Garcia", "Design", "UX Designer"),
-            Participant("robert.martinez@company.com", "Robert Martinez", "Engineering", "Tech Lead"),
-            Participant("jennifer.lee@company.com", "Jennifer Lee", "Marketing", "Content Manager"),
-            Participant("michael.johnson@company.com", "Michael Johnson", "Sales", "Account Executive"),
-            Participant("sarah.davis@company.com", "Sarah Davis", "Engineering", "QA Engineer"),
-            Participant("john.brown@company.com", "John Brown", "Finance", "Controller"),
-            Participant("amy.wilson@company.com", "Amy Wilson", "HR", "Recruiter"),
-            Participant("chris.miller@company.com", "Chris Miller", "Operations", "Project Manager"),
+        # Each participant gets a random availability status, drawn for all of them at once
+        statuses = self._rng.choice(["available", "busy", "unknown"], len(_DIRECTORY)).tolist()
+        return [
+            Participant(*entry, availability_status=status)
+            for entry, status in zip(_DIRECTORY, statuses)
         ]
-        
-        # Set random availability status
-        for p in participants:
-            p.availability_status = random.choice(["available", "busy", "unknown"])
-        
-        return participants
     
     def _generate_mock_meetings(self) -> List[Meeting]:
         """Generate mock meetings for the past few days"""
-        meetings = []
         base_date = datetime.now() - timedelta(days=7)
         
-        meeting_titles = [
-            "Daily Standup", "Sprint Planning", "Client Review", "Team Retrospective",
-            "Project Kickoff", "Budget Meeting", "Training Session", "All Hands",
-            "Design Review", "Code Review", "Strategy Meeting", "Performance Review"
+        # Draw each column for every meeting in one call rather than per meeting
+        count = 20
+        rng = self._rng
+        day_offsets = rng.integers(0, 15, count).tolist()
+        hours = rng.integers(9, 18, count).tolist()
+        minutes = rng.choice([0, 30], count).tolist()
+        durations = rng.choice(list(_DURATION_DELTAS), count).tolist()
+        group_sizes = rng.integers(2, 6, count).tolist()
+        titles = rng.choice(_MEETING_TITLES, count).tolist()
+        priorities = rng.choice(["low", "medium", "high"], count).tolist()
+        statuses = rng.choice(["scheduled", "completed"], count).tolist()
+        
+        start_times = [
+            base_date + timedelta(days=day_offset, hours=hour, minutes=minute)
+            for day_offset, hour, minute in zip(day_offsets, hours, minutes)
+        ]
+        # Each meeting takes its attendees from the front of its own shuffle of the directory
+        participants = self.mock_participants
+        shuffles = rng.permuted(np.tile(np.arange(len(participants)), (count, 1)), axis=1).tolist()
+        attendee_groups = [
+            [participants[j] for j in shuffle[:size]]
+            for shuffle, size in zip(shuffles, group_sizes)
         ]
         
-        for i in range(20):
-            meeting_date = base_date + timedelta(
-                days=random.randint(0, 14),
-                hours=random.randint(9, 17),
-                minutes=random.choice([0, 30])
-            )
-            
-            duration = random.choice([30, 60, 90, 120])
-            participants = random.sample(self.mock_participants, random.randint(2, 5))
-            
-            meeting = Meeting(
+        return [
+            Meeting(
                 id=f"meeting_{i+1}",
-                title=random.choice(meeting_titles),
+                title=titles[i],
                 description=f"Auto-generated meeting {i+1}",
-                organizer=participants[0].email,
-                participants=participants,
-                start_time=meeting_date,
-                end_time=meeting_date + timedelta(minutes=duration),
-                duration_minutes=duration,
-                priority=random.choice(["low", "medium", "high"]),
-                status=random.choice(["scheduled", "completed"]),
-                created_at=meeting_date - timedelta(days=1)
+                organizer=attendee_groups[i][0].email,
+                participants=attendee_groups[i],
+                start_time=start_times[i],
+                end_time=start_times[i] + _DURATION_DELTAS[durations[i]],
+                duration_minutes=durations[i],
+                priority=priorities[i],
+                status=statuses[i],
+                created_at=start_times[i] - _ONE_DAY
             )
-            meetings.append(meeting)
-        
-        return meetings
+            for i in range(count)
+        ]
     
-    def get_participants(self) -> List[Participant]:
-        """Get all mock participants"""
-        return self.mock_participants.copy()
+    def get_participants(self, copy: bool = False) -> Sequence[Participant]:
+        """Get all mock participants as a shared read-only tuple, or a new list with copy=True"""
+        if copy:
+            return list(self._participants)
+        return self._participants
     
-    def get_meetings(self) -> List[Meeting]:
-        """Get all mock meetings"""
-        return self.mock_meetings.copy()
+    def get_meetings(self, copy: bool = False) -> Sequence[Meeting]:
+        """Get all mock meetings as a shared read-only tuple, or a new list with copy=True"""
+        if copy:
+            return list(self._meetings)
+        return self._meetings
     
     def search_participants(self, query: str, limit: int = 10) -> List[Participant]:
         """Search participants by name or email"""
@@ -89,65 +175,72 @@ class MockDataGenerator:
         if not query:
             return []
         
-        matches = []
-        for participant in self.mock_participants:
-            # Check exact email match
-            if query == participant.email.lower():
-                matches.insert(0, participant)  # Exact email match goes first
-                continue
+        # Exact email match goes first
+        exact = self._by_email.get(query)
+        matches = [exact] if exact else []
+        
+        participants = self._participants
+        emails_lower = self._emails_lower
+        for i, name_lower in enumerate(self._names_lower):
+            if len(matches) >= limit:
+                break
             
             # Check if query appears in name or email
-            name_match = query in participant.name.lower()
-            email_match = query in participant.email.lower()
-            
-            if name_match or email_match:
-                matches.append(participant)
+            if (query in name_lower or query in emails_lower[i]) and participants[i] is not exact:
+                matches.append(participants[i])
         
         return matches[:limit]
     
     def get_participant_by_email(self, email: str) -> Participant:
         """Get participant by exact email match"""
-        for participant in self.mock_participants:
-            if participant.email.lower() == email.lower():
-                return participant
-        return None
+        return self._by_email.get(email.lower())
     
     def get_availability(self, participant_emails: List[str], date_range: tuple) -> Dict[str, str]:
         """Get mock availability for participants in date range"""
-        availability = {}
-        for email in participant_emails:
-            participant = self.get_participant_by_email(email)
-            if participant:
-                # Simulate some conflicts
-                if random.random() < 0.3:  # 30% chance of conflict
-                    availability[email] = "busy"
-                else:
-                    availability[email] = "available"
-            else:
-                availability[email] = "unknown"
-        return availability
-    
-    def save_to_file(self, filename: str = "mock_data.json"):
-        """Save mock data to JSON file"""
-        data = {
-            "participants": [p.to_dict() for p in self.mock_participants],
-            "meetings": [m.to_dict() for m in self.mock_meetings]
+        by_email = self._by_email
+        # Simulate some conflicts: one batch draw with a 30% chance of conflict per email
+        conflicts = (self._rng.random(len(participant_emails)) < 0.3).tolist()
+        return {
+            email: ("busy" if conflict else "available") if email.lower() in by_email else "unknown"
+            for email, conflict in zip(participant_emails, conflicts)
         }
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+    
+    def save_to_file(self, filename: str = "mock_data.json", pretty: bool = False):
+        """Save mock data to JSON file, compact unless pretty is set"""
+        if orjson is not None:
+            # orjson writes dataclass fields and ISO datetimes itself, giving the same document
+            # as to_dict() without the intermediate dicts, as one bytes buffer in a single write
+            data = {"participants": self.mock_participants, "meetings": self.mock_meetings}
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            data = {
+                "participants": [p.to_dict() for p in self.mock_participants],
+                "meetings": [m.to_dict() for m in self.mock_meetings]
+            }
+            with open(filename, 'w') as f:
+                if pretty:
+                    json.dump(data, f, indent=2)
+                else:
+                    json.dump(data, f, separators=(',', ':'))
     
     def load_from_file(self, filename: str = "mock_data.json"):
         """Load mock data from JSON file"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    data = json.load(f)
             
-            self.mock_participants = [
+            self.set_participants([
                 Participant.from_dict(p) for p in data.get("participants", [])
-            ]
-            self.mock_meetings = [
-                Meeting.from_dict(m) for m in data.get("meetings", [])
-            ]
+            ])
+            with batch_timestamp():
+                self.set_meetings([
+                    Meeting.from_dict(m) for m in data.get("meetings", [])
+                ])
         except FileNotFoundError:
             # Use default generated data if file doesn't exist
             pass